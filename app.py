@@ -1,54 +1,76 @@
+import math
 import streamlit as st
 import spacy
 from spacy_layout import spaCyLayout
 import pandas as pd
-from collections import Counter
 
 st.set_page_config(page_title="📄 PDF Extractor", layout="wide")
 st.title("📄 Extract Info from PDF using spaCyLayout")
 
-uploaded_file = st.file_uploader("Upload a PDF file", type=["pdf"])
-if uploaded_file:
-    with open("temp.pdf", "wb") as f:
-        f.write(uploaded_file.read())
+SPANS_PER_PAGE = 50
 
-    # Load NLP pipeline
-    nlp = spacy.load("en_core_web_sm")  # or "en_core_sci_sm"
-    layout = spaCyLayout(nlp)
-    doc = layout("temp.pdf")
 
-    # Display full text
-    st.subheader("📜 Full Text")
-    st.text_area("Text", doc.text, height=300)
+@st.cache_resource(show_spinner=False)
+def load_layout():
+    """Build the spaCy pipeline and spaCyLayout converter once per server process."""
+    # spaCyLayout only needs a tokenizer; nothing here reads tags, parses or entities
+    nlp = spacy.blank("en")
+    return spaCyLayout(nlp)
+
+
+@st.cache_data(show_spinner=False, max_entries=8)
+def analyze_pdf(pdf_bytes):
+    """Parse the PDF once per unique upload and return plain, cacheable results."""
+    # spaCyLayout accepts raw bytes, so there is no need for a round trip through disk
+    layout = load_layout()
+    doc = layout(pdf_bytes)
 
     # Extract tables safely
-    st.subheader("📊 Tables")
-    if doc._.tables:
-        for i, table in enumerate(doc._.tables):
-            st.write(f"Table {i+1}")
+    tables = []
+    for table in doc._.tables:
+        raw_data = table._.data
+        df = pd.DataFrame(raw_data)
+
+        # Fix empty column names
+        names = pd.Series([col if str(col).strip() else f"Unnamed_{i}" for i, col in enumerate(df.columns)])
+
+        # Fix duplicate column names ("a", "a" -> "a", "a.1")
+        dup_index = names.groupby(names, sort=False, dropna=False).cumcount()
+        df.columns = [f"{name}.{k}" if k else name for name, k in zip(names, dup_index)]
 
-            raw_data = table._.data
-            df = pd.DataFrame(raw_data)
+        tables.append(df)
 
-            # Fix empty column names
-            df.columns = [col if str(col).strip() else f"Unnamed_{i}" for i, col in enumerate(df.columns)]
+    spans = [(span.label_, span.text) for span in doc.spans["layout"]]
+    return {"text": doc.text, "tables": tables, "spans": spans}
 
-            # Fix duplicate column names
-            counts = Counter()
-            new_cols = []
-            for col in df.columns:
-                counts[col] += 1
-                if counts[col] > 1:
-                    new_cols.append(f"{col}.{counts[col]-1}")
-                else:
-                    new_cols.append(col)
-            df.columns = new_cols
 
+uploaded_file = st.file_uploader("Upload a PDF file", type=["pdf"])
+if uploaded_file:
+    with st.spinner("Analyzing PDF..."):
+        analysis = analyze_pdf(uploaded_file.getvalue())
+
+    # Display full text
+    st.subheader("📜 Full Text")
+    st.text_area("Text", analysis["text"], height=300)
+
+    st.subheader("📊 Tables")
+    if analysis["tables"]:
+        for i, df in enumerate(analysis["tables"]):
+            st.write(f"Table {i+1}")
             st.dataframe(df)
     else:
         st.info("No tables detected.")
 
     # Show layout-labeled spans (headers, footers, authors, abstracts, etc.)
     st.subheader("🔍 Detected Spans (Headers, Abstracts, Authors, etc.)")
-    for span in doc.spans["layout"]:
-        st.markdown(f"**{span.label_}:** {span.text}")  
+    spans = analysis["spans"]
+    if spans:
+        # Render one page of spans per rerun so long PDFs don't freeze the UI
+        num_pages = math.ceil(len(spans) / SPANS_PER_PAGE)
+        page = st.number_input("Page", min_value=1, max_value=num_pages, value=1) if num_pages > 1 else 1
+        start = (page - 1) * SPANS_PER_PAGE
+        for label, text in spans[start:start + SPANS_PER_PAGE]:
+            st.markdown(f"**{label}:** {text}")
+        st.caption(f"Showing {start + 1}-{min(start + SPANS_PER_PAGE, len(spans))} of {len(spans)} spans")
+    else:
+        st.info("No layout spans detected.")